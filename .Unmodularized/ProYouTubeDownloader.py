@@ -1,20 +1,41 @@
 import tkinter
 import customtkinter as ctk
+import concurrent.futures
+import errno
 import threading
 import os
 import re
+import shutil
+import tempfile
 import time
 import subprocess
 from tkinter import messagebox, filedialog
 from pytubefix import Playlist, YouTube
 from PIL import Image, ImageTk
 import requests
-from io import BytesIO
 
 
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("blue")
 
+# Precompiled patterns - sanitize runs once per video title and the digit
+# strip runs inside the audio-quality sort key
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+_DIGITS_RE = re.compile(r'\D')
+
+# Pooled session so thumbnail fetches reuse keep-alive connections instead
+# of a fresh TLS handshake per request
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# visitorData / poToken pair handed to pytubefix's po_token_verifier.
+# Hoisted to a constant so the verifier doesn't rebuild a dict per call.
+# --- IMPORTANT: REPLACE THESE PLACEHOLDERS ---
+_MY_TOKENS = (
+    "CgtzSkVEU3A0dy1CbyjIg53IBjIKCgJJThIEGgAgZg%3D%3D",
+    "MnhYzVhTDMr5h1jxZdzSP3KgDtZ4_-ziEIvt4SWAsfOcM9_SHfcHKm2gnDEyv8BnQ-xFp4TIrh5S5PpsqrzNB6fEMy4T5dAoo9dvvxOu0Ee7ybPcO6-usYaeMkDKlTmRMrC55Wkl3OmJ54oPzSs3YDolgd6F6iUYPg8=",
+)
+
 class App(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -26,6 +47,7 @@ class App(ctk.CTk):
         self.download_dir = os.path.expanduser("~/Downloads")
         self.is_playlist = False
         self.video_streams = None
+        self._last_ui = 0.0
 
         # UI Frames and Widgets setup...
         self.setup_ui()
@@ -106,7 +128,7 @@ class App(ctk.CTk):
         self.stats_label.grid(row=2, column=0, padx=10, pady=(0,5), sticky="w")
 
     def sanitize(self, name):
-        return re.sub(r'[<>:"/\\|?*]', '-', name)
+        return _SANITIZE_RE.sub('-', name)
 
     def fetch_details_thread(self, event=None):
         threading.Thread(target=self.fetch_details, daemon=True).start()
@@ -115,13 +137,9 @@ class App(ctk.CTk):
         """
         This function MUST return your visitorData and po_token.
         You need to acquire these values yourself (e.g., from your
-        browser's developer tools) and paste them here.
+        browser's developer tools) and paste them into _MY_TOKENS above.
         """
-        # --- IMPORTANT: REPLACE THESE PLACEHOLDERS ---
-        data={"visitorData":"CgtzSkVEU3A0dy1CbyjIg53IBjIKCgJJThIEGgAgZg%3D%3D","poToken":"MnhYzVhTDMr5h1jxZdzSP3KgDtZ4_-ziEIvt4SWAsfOcM9_SHfcHKm2gnDEyv8BnQ-xFp4TIrh5S5PpsqrzNB6fEMy4T5dAoo9dvvxOu0Ee7ybPcO6-usYaeMkDKlTmRMrC55Wkl3OmJ54oPzSs3YDolgd6F6iUYPg8="}
-        my_visitor_data = data["visitorData"]
-        my_po_token = data["poToken"]
-        return (my_visitor_data, my_po_token)
+        return _MY_TOKENS
 
     def fetch_details(self):
         url = self.url_entry.get().strip()
@@ -153,45 +171,70 @@ class App(ctk.CTk):
                 self.videos_to_download = [video]
                 self.listbox.insert(tkinter.END, f"1. {video.title} - Pending")
 
-            # Load thumbnail
-            try:
-                response = requests.get(first_video.thumbnail_url)
-                img_data = Image.open(BytesIO(response.content))
-                thumbnail_img = ctk.CTkImage(img_data, size=(120, 90))
-                self.thumbnail_label.configure(image=thumbnail_img)
-            except:
-                pass  # Keep placeholder if thumbnail fails
+            # Load thumbnail on its own thread so it doesn't serialize
+            # behind stream enumeration
+            threading.Thread(target=self.load_thumbnail, args=(first_video.thumbnail_url,), daemon=True).start()
 
             self.video_streams = first_video.streams
             self.update_quality_options(self.mode_var.get())
             self.download_button.configure(state="normal")
             self.quality_menu.configure(state="normal")
-            
+
+            # Warm every playlist video's streams in the background while the
+            # user is still picking a quality; pytubefix caches the result on
+            # each object, so download_logic later hits memory, not the network
+            if len(self.videos_to_download) > 1:
+                threading.Thread(target=self._prefetch_streams, args=(list(self.videos_to_download),), daemon=True).start()
+
         except Exception as e:
             self.title_label.configure(text=f"Error: {e}")
             print(e)
 
+    def _prefetch_streams(self, videos):
+        def warm(video):
+            # One bad video must not kill the whole prefetch
+            try:
+                video.streams
+            except Exception as e:
+                print(f"Stream prefetch failed: {e}")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(warm, videos))
+
+    def load_thumbnail(self, url):
+        try:
+            # Stream the response straight into PIL instead of buffering the
+            # whole JPEG in memory first
+            with _SESSION.get(url, stream=True, timeout=5) as response:
+                response.raw.decode_content = True
+                img_data = Image.open(response.raw)
+                img_data.load()
+            thumbnail_img = ctk.CTkImage(img_data, size=(120, 90))
+            self.thumbnail_label.configure(image=thumbnail_img)
+        except:
+            pass  # Keep placeholder if thumbnail fails
+
     def update_quality_options(self, selected_mode: str):
         if self.video_streams is None:
             self.quality_menu.configure(values=["Fetch URL first"], state="disabled")
             self.quality_var.set("Fetch URL first")
             return
 
-        qualities = []
+        # Single pass over the streams instead of separate progressive /
+        # adaptive / audio filter scans, each of which walks the whole list
+        all_resolutions = set()
+        all_abrs = set()
+        for stream in self.video_streams:
+            if stream.resolution:
+                all_resolutions.add(stream.resolution)
+            elif stream.abr:
+                all_abrs.add(stream.abr)
+
         if selected_mode == "Audio":
-            streams = self.video_streams.filter(only_audio=True).order_by("abr").desc()
-            qualities = sorted(list(set([s.abr for s in streams if s.abr])), 
-                             key=lambda x: int(re.sub(r'\D', '', x)), reverse=True)
+            qualities = sorted(all_abrs,
+                             key=lambda x: int(_DIGITS_RE.sub('', x)), reverse=True)
         else:  # Video
-            progressive_streams = self.video_streams.filter(progressive=True)
-            adaptive_streams = self.video_streams.filter(only_video=True)
-            all_resolutions = set()
-            
-            for stream in list(progressive_streams) + list(adaptive_streams):
-                if stream.resolution:
-                    all_resolutions.add(stream.resolution)
-            
-            qualities = sorted(list(all_resolutions), 
+            qualities = sorted(all_resolutions,
                              key=lambda x: int(x[:-1]), reverse=True)
         
         if not qualities: 
@@ -202,37 +245,156 @@ class App(ctk.CTk):
         self.quality_menu.configure(state="normal")
 
     def choose_dir(self):
+        # Tk GUI calls are only supported from the thread running the
+        # interpreter - a worker-thread dialog aborts on macOS - so the
+        # native dialog stays on the main thread
         path = filedialog.askdirectory(initialdir=self.download_dir)
         if path:
             self.download_dir = path
             self.dir_label.configure(text=f"Folder: {self.download_dir}")
 
     def on_progress(self, stream, chunk, bytes_remaining):
+        # Coalesce updates to ~30 Hz - this fires once per ~9 KB chunk - and
+        # never touch Tk from the download thread; update_idletasks here was
+        # both unsafe and forced a repaint per chunk
+        now = time.monotonic()
+        if now - self._last_ui < 0.033 and bytes_remaining > 0:
+            return
+        self._last_ui = now
+
         total = stream.filesize
         downloaded = total - bytes_remaining
         percent = downloaded / total
-        self.progressbar.set(percent)
-        
+
         try:
             elapsed = time.time() - self.start_time
             speed = downloaded / elapsed if elapsed > 0 else 0
             eta = (total - downloaded) / speed if speed > 0 else 0
             stats_str = f"{downloaded/1e6:.2f}MB / {total/1e6:.2f}MB | Speed: {speed/1e6:.2f} MB/s | ETA: {int(eta)}s"
-            self.stats_label.configure(text=stats_str)
         except AttributeError:
-            self.stats_label.configure(text=f"{downloaded/1e6:.2f}MB / {total/1e6:.2f}MB")
-        
-        self.update_idletasks()
+            stats_str = f"{downloaded/1e6:.2f}MB / {total/1e6:.2f}MB"
+
+        self.after(0, self.progressbar.set, percent)
+        # CTk widgets take no positional option dict; pass text as a keyword
+        self.after(0, lambda t=stats_str: self.stats_label.configure(text=t))
 
     def start_download(self):
         self.download_button.configure(state="disabled")
         self.fetch_button.configure(state="disabled")
         threading.Thread(target=self.download_logic, daemon=True).start()
 
+    def merge_streams_piped(self, idx, title, video_stream, audio_stream, merged):
+        # POSIX-only: feed both streams through named pipes into ffmpeg so the
+        # bytes go network -> ffmpeg -> merged file without intermediate
+        # _v.mp4/_a.mp4 writes and re-reads.
+        fifo_dir = tempfile.mkdtemp()
+        vfifo = os.path.join(fifo_dir, "video.pipe")
+        afifo = os.path.join(fifo_dir, "audio.pipe")
+        try:
+            os.mkfifo(vfifo)
+            os.mkfifo(afifo)
+
+            try:
+                proc = subprocess.Popen([
+                    "ffmpeg", "-y", "-i", vfifo, "-i", afifo, "-c", "copy", merged
+                ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            except FileNotFoundError:
+                raise Exception("FFmpeg not found. Please install FFmpeg and add it to your PATH.")
+
+            def feed(stream, fifo):
+                # Non-blocking open with retry: a plain open() blocks until
+                # ffmpeg opens the read end, which never happens if ffmpeg
+                # died at startup - the old join() then hung forever
+                fd = None
+                while fd is None:
+                    try:
+                        fd = os.open(fifo, os.O_WRONLY | os.O_NONBLOCK)
+                    except OSError as e:
+                        if e.errno != errno.ENXIO:
+                            raise
+                        if proc.poll() is not None:
+                            raise Exception("FFmpeg exited before reading its input pipes")
+                        time.sleep(0.05)
+                os.set_blocking(fd, True)
+                with os.fdopen(fd, "wb") as pipe:
+                    stream.stream_to_buffer(pipe)
+
+            feeder_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+            feeders = [
+                feeder_pool.submit(feed, video_stream, vfifo),
+                feeder_pool.submit(feed, audio_stream, afifo),
+            ]
+            try:
+                for feeder in feeders:
+                    feeder.result()
+            except Exception:
+                # Reap ffmpeg so the other feeder unblocks (EPIPE/ENXIO)
+                # and no zombie is left behind
+                proc.kill()
+                proc.wait()
+                raise
+            finally:
+                feeder_pool.shutdown(wait=True)
+
+            if proc.wait() != 0:
+                raise Exception("FFmpeg merging failed")
+
+            self.listbox.delete(idx)
+            self.listbox.insert(idx, f"{title} - ✔ Completed")
+        except Exception as e:
+            self.listbox.delete(idx)
+            self.listbox.insert(idx, f"{title} - ❌ FAILED")
+            print(f"Error merging {title}: {e}")
+            self.after(100, lambda err=str(e), t=title: messagebox.showerror(
+                "Download Error",
+                f"Failed to merge '{t}'.\n\nError: {err}\n\n"
+                f"For video merging issues, ensure FFmpeg is installed and in your PATH."
+            ))
+        finally:
+            # The FIFOs vanish with their temp directory
+            shutil.rmtree(fifo_dir, ignore_errors=True)
+
+    def merge_streams(self, idx, title, vfile, afile, merged):
+        # Runs on the ffmpeg executor so merging overlaps with the next
+        # video's downloads.
+        try:
+            try:
+                subprocess.run([
+                    "ffmpeg", "-y", "-i", vfile, "-i", afile, "-c", "copy", merged
+                ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+            except subprocess.CalledProcessError as e:
+                raise Exception(f"FFmpeg merging failed: {e}")
+            except FileNotFoundError:
+                raise Exception("FFmpeg not found. Please install FFmpeg and add it to your PATH.")
+
+            self.listbox.delete(idx)
+            self.listbox.insert(idx, f"{title} - ✔ Completed")
+        except Exception as e:
+            self.listbox.delete(idx)
+            self.listbox.insert(idx, f"{title} - ❌ FAILED")
+            print(f"Error merging {title}: {e}")
+            self.after(100, lambda err=str(e), t=title: messagebox.showerror(
+                "Download Error",
+                f"Failed to merge '{t}'.\n\nError: {err}\n\n"
+                f"For video merging issues, ensure FFmpeg is installed and in your PATH."
+            ))
+        finally:
+            # Clean up temporary files
+            try:
+                os.remove(vfile)
+                os.remove(afile)
+            except:
+                pass  # Continue even if cleanup fails
+
     def download_logic(self):
         mode = self.mode_var.get()
         quality = self.quality_var.get()
-        
+
+        # Single-worker executor so ffmpeg merges run in the background
+        # while the next video's streams are already downloading.
+        ffmpeg_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        mux_futures = []
+
         folder_name = self.sanitize(self.title_label.cget("text").replace("Playlist: ", "").replace("Video: ", ""))
         save_path = os.path.join(self.download_dir, folder_name)
         
@@ -256,69 +418,81 @@ class App(ctk.CTk):
             self.stats_label.configure(text="")
             self.start_time = time.time()
             
-            # Create YouTube object with progress callback
-            yt = YouTube(video.watch_url, on_progress_callback=self.on_progress, use_po_token=True, po_token_verifier=self.get_my_tokens)
+            # Reuse the YouTube object fetched earlier - rebuilding it here
+            # would redo the metadata round-trip and cipher solve per video
+            video.register_on_progress_callback(self.on_progress)
 
             try:
                 if mode == "Audio":
                     # Audio download - use original working logic
-                    stream = yt.streams.filter(only_audio=True, abr=quality).first()
+                    stream = video.streams.filter(only_audio=True, abr=quality).first()
                     if not stream:
-                        stream = yt.streams.filter(only_audio=True).order_by("abr").desc().first()
+                        stream = video.streams.filter(only_audio=True).order_by("abr").desc().first()
                     
                     stream.download(output_path=save_path, filename=f"{title}.mp3")
                     
                 else:  # Video download
                     # Try progressive first (single file with audio+video)
-                    stream = yt.streams.filter(progressive=True, res=quality).first()
+                    stream = video.streams.filter(progressive=True, res=quality).first()
                     
                     if stream:
                         # Progressive stream available - direct download
                         stream.download(output_path=save_path, filename=f"{title}.mp4")
                     else:
                         # Need to merge separate video and audio streams
-                        # Using the WORKING logic from your old code
-                        self.listbox.delete(idx)
-                        self.listbox.insert(idx, f"{title} - Merging files...")
-                        self.update_idletasks()
-                        
                         # Get video and audio streams (using old code's approach)
-                        video_stream = yt.streams.filter(only_video=True, res=quality).order_by("resolution").desc().first()
-                        audio_stream = yt.streams.filter(only_audio=True).order_by("abr").desc().first()
-                        
+                        video_stream = video.streams.filter(only_video=True, res=quality).order_by("resolution").desc().first()
+                        audio_stream = video.streams.filter(only_audio=True).order_by("abr").desc().first()
+
                         if not video_stream or not audio_stream:
                             raise Exception("Required streams not found")
-                        
+
+                        merged = os.path.join(save_path, title + ".mp4")
+
+                        if hasattr(os, "mkfifo"):
+                            # POSIX: pipe both downloads straight into ffmpeg
+                            # via named pipes - no temp files, and the mux
+                            # overlaps the network transfer of this video.
+                            # Runs inline: the downloads ARE the merge here,
+                            # so queueing it on the single-worker mux
+                            # executor would serialize whole items behind it
+                            # while mislabelling them as merging, and
+                            # self.start_time would be stale by the time
+                            # each queued item actually ran.
+                            self.merge_streams_piped(idx, title, video_stream, audio_stream, merged)
+                            continue  # merge_streams_piped marks completion
+
+                        # Windows fallback: download to temp files, merge after
                         # File paths using old code's naming convention
                         vfile = os.path.join(save_path, title + "_v.mp4")
-                        afile = os.path.join(save_path, title + "_a.mp4") 
-                        merged = os.path.join(save_path, title + ".mp4")
-                        
-                        # Download separate streams
-                        video_stream.download(output_path=save_path, filename=title + "_v.mp4")
-                        audio_stream.download(output_path=save_path, filename=title + "_a.mp4")
-                        
-                        # Merge using ffmpeg (exact same command as old working code)
-                        try:
-                            subprocess.run([
-                                "ffmpeg", "-y", "-i", vfile, "-i", afile, "-c", "copy", merged
-                            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
-                        except subprocess.CalledProcessError as e:
-                            raise Exception(f"FFmpeg merging failed: {e}")
-                        except FileNotFoundError:
-                            raise Exception("FFmpeg not found. Please install FFmpeg and add it to your PATH.")
-                        
-                        # Clean up temporary files
-                        try:
-                            os.remove(vfile)
-                            os.remove(afile)
-                        except:
-                            pass  # Continue even if cleanup fails
+                        afile = os.path.join(save_path, title + "_a.mp4")
+
+                        # Download video and audio streams concurrently -
+                        # two independent HTTP GETs from the same CDN
+                        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as stream_pool:
+                            futures = [
+                                stream_pool.submit(video_stream.download, output_path=save_path, filename=title + "_v.mp4"),
+                                stream_pool.submit(audio_stream.download, output_path=save_path, filename=title + "_a.mp4"),
+                            ]
+                            concurrent.futures.wait(futures)
+                            for future in futures:
+                                future.result()
+
+                        self.listbox.delete(idx)
+                        self.listbox.insert(idx, f"{title} - Merging files...")
+
+                        # Queue the CPU-bound mux on the background executor and
+                        # move straight on; the next video's downloads overlap
+                        # with this merge.
+                        mux_futures.append(
+                            ffmpeg_executor.submit(self.merge_streams, idx, title, vfile, afile, merged)
+                        )
+                        continue  # Completion is marked when the merge finishes
 
                 # Success
                 self.listbox.delete(idx)
                 self.listbox.insert(idx, f"{title} - ✔ Completed")
-                
+
             except Exception as e:
                 # Error handling
                 self.listbox.delete(idx)
@@ -332,6 +506,11 @@ class App(ctk.CTk):
                     f"For video merging issues, ensure FFmpeg is installed and in your PATH."
                 ))
 
+        # Wait for any queued merges to finish before declaring completion
+        if mux_futures:
+            concurrent.futures.wait(mux_futures)
+        ffmpeg_executor.shutdown()
+
         # All downloads complete
         self.download_button.configure(state="normal")
         self.fetch_button.configure(state="normal")
@@ -5,11 +5,13 @@ Main GUI application for Pro YouTube Downloader using CustomTkinter.
 Handles user interface, threading for downloads, and progress tracking.
 """
 
+import asyncio
 import logging
 import os
+import sys
 import threading
+import time
 import tkinter
-from io import BytesIO
 from tkinter import filedialog, messagebox
 from typing import Any, Callable, List, Optional
 
@@ -17,12 +19,26 @@ import customtkinter as ctk
 import requests
 from PIL import Image
 
+from utils.async_downloader import MAX_CONCURRENT_DOWNLOADS, download_one
+from utils.helpers import sanitize_filename
+from utils.http import SESSION
 from utils.youtube_handler import YouTubeHandler
 
 from . import ui_components
 
 logger = logging.getLogger(__name__)
 
+# Use uvloop for the download event loop where available. It is a drop-in
+# libuv-backed loop with much lower per-callback overhead than the default
+# selector loop; uvloop is POSIX-only, so Windows keeps the default loop.
+if sys.platform != "win32":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
 # Configure CustomTkinter theme
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("blue")
@@ -47,7 +63,11 @@ class App(ctk.CTk):
         self.download_dir: str = os.path.expanduser("~/Downloads")
         self.videos_to_download: List[Any] = []
         self.video_streams: Optional[Any] = None
+        self.quality_options: Optional[dict] = None
         self.handler: YouTubeHandler = YouTubeHandler()
+        self._listbox_titles: List[str] = []
+        self._last_ui: float = 0.0
+        self._last_fetched_url: Optional[str] = None
 
         logger.info("Initializing Pro YouTube Downloader application")
 
@@ -109,10 +129,12 @@ class App(ctk.CTk):
         threading.Thread(target=self.fetch_details, daemon=True).start()
 
     def start_download(self) -> None:
-        """Start a background thread to download the selected videos."""
+        """Start a background thread running the download event loop."""
         self.download_button.configure(state="disabled")
         self.fetch_button.configure(state="disabled")
-        threading.Thread(target=self.download_logic, daemon=True).start()
+        threading.Thread(
+            target=lambda: asyncio.run(self._download_all()), daemon=True
+        ).start()
 
     # --- Backend Logic (executed in threads) ---
 
@@ -120,7 +142,9 @@ class App(ctk.CTk):
         """
         Fetch video/playlist details from the provided URL.
 
-        Executed in a background thread to avoid blocking the UI.
+        Executed in a background thread to avoid blocking the UI. Fetching
+        the same URL twice in a row bypasses the metadata cache, so
+        clicking Fetch again refreshes a playlist whose contents changed.
         """
         url: str = self.url_entry.get().strip()
         if not url:
@@ -128,16 +152,22 @@ class App(ctk.CTk):
             self.after(0, self.reset_ui_state)
             return
 
-        self.after(0, self.title_label.configure, {"text": "Fetching details, please wait..."})
+        self.after(
+            0, lambda: self.title_label.configure(text="Fetching details, please wait...")
+        )
+        refresh: bool = url == self._last_fetched_url
+        self._last_fetched_url = url
         logger.info(f"Fetching details from: {url}")
-        details: dict = self.handler.fetch_details(url)
+        details: dict = self.handler.fetch_details(url, refresh=refresh)
         self.after(0, self.update_ui_with_details, details)
 
-    def download_logic(self) -> None:
+    async def _download_all(self) -> None:
         """
-        Handle the download process for all selected videos.
+        Download all selected videos concurrently.
 
-        Executed in a background thread. Updates UI progress in real-time.
+        Runs on a private asyncio loop inside a background thread. A semaphore
+        bounds how many downloads are in flight so a large playlist does not
+        open an unbounded number of connections.
         """
         mode: str = self.mode_var.get()
         quality: str = self.quality_var.get()
@@ -145,38 +175,94 @@ class App(ctk.CTk):
 
         base_path: str = self.download_dir
         if is_playlist:
-            playlist_title: str = self.handler.helpers.sanitize_filename(
+            playlist_title: str = sanitize_filename(
                 self.title_label.cget("text").replace("Playlist: ", "")
             )
             base_path = os.path.join(self.download_dir, playlist_title)
             os.makedirs(base_path, exist_ok=True)
             logger.info(f"Downloading playlist to: {base_path}")
 
-        for idx, video in enumerate(self.videos_to_download):
-            self.update_listbox_status(idx, "Downloading...")
-            self.reset_progress()
+        sem = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+        try:
+            await asyncio.gather(
+                *[
+                    self._download_item(idx, video, quality, mode, base_path, is_playlist, sem)
+                    for idx, video in enumerate(self.videos_to_download)
+                ]
+            )
+        finally:
+            # Re-enable the buttons even if a download task raised;
+            # otherwise the UI stays dead until restart
+            self.after(0, self.finalize_downloads)
+
+    async def _download_item(
+        self,
+        idx: int,
+        video: Any,
+        quality: str,
+        mode: str,
+        base_path: str,
+        is_playlist: bool,
+        sem: asyncio.Semaphore,
+    ) -> None:
+        """
+        Download one video and reflect its status in the listbox.
 
-            try:
-                # Setup progress callback for pytubefix
-                video.register_on_progress_callback(self.on_progress)
+        Args:
+            idx (int): Index of the video in the list
+            video: YouTube object from pytubefix
+            quality (str): Selected quality (resolution or bitrate)
+            mode (str): "Audio" or "Video"
+            base_path (str): Directory to save the file
+            is_playlist (bool): Whether a playlist is being downloaded
+            sem (asyncio.Semaphore): Bounds the number of parallel downloads
+        """
+        try:
+            # Setup progress callback for pytubefix
+            video.register_on_progress_callback(self.on_progress)
+
+            prefix: str = f"{idx+1:02d}." if is_playlist else ""
+            await download_one(
+                self.handler,
+                video,
+                quality,
+                mode,
+                base_path,
+                prefix,
+                sem,
+                on_start=lambda: self._mark_download_started(idx),
+            )
+            self.update_listbox_status(idx, "✔ Completed")
+        except Exception as e:
+            logger.error(f"Download failed for video {idx+1}: {e}")
+            self.update_listbox_status(idx, f"❌ FAILED - {str(e)[:50]}")
+            # Use the cached display title: on a cache hit the YouTube
+            # object is lazy and video.title would be a network call that
+            # can raise again right here (e.g. offline), killing the task
+            self.after(
+                100,
+                lambda err=str(e), t=self._listbox_titles[idx]: messagebox.showerror(
+                    "Download Error", f"Failed to download '{t}'.\n\nError: {err}"
+                ),
+            )
 
-                # Download
-                prefix: str = f"{idx+1:02d}." if is_playlist else ""
-                logger.info(f"Downloading video {idx+1}/{len(self.videos_to_download)}: {video.title}")
-                self.handler.download(video, quality, mode, base_path, prefix)
+    def _mark_download_started(self, idx: int) -> None:
+        """
+        Mark a video as downloading once its semaphore slot is acquired.
 
-                self.update_listbox_status(idx, "✔ Completed")
-            except Exception as e:
-                logger.error(f"Download failed for video {idx+1}: {e}")
-                self.update_listbox_status(idx, f"❌ FAILED - {str(e)[:50]}")
-                self.after(
-                    100,
-                    lambda err=str(e), t=video.title: messagebox.showerror(
-                        "Download Error", f"Failed to download '{t}'.\n\nError: {err}"
-                    ),
-                )
+        Runs on the event-loop thread, so only the cached display title is
+        logged; touching video.title here would be a blocking watch-page
+        fetch on the loop for lazily rebuilt (cache-hit) objects.
 
-        self.after(0, self.finalize_downloads)
+        Args:
+            idx (int): Index of the video in the list
+        """
+        self.update_listbox_status(idx, "Downloading...")
+        self.after(0, self.reset_progress)
+        logger.info(
+            f"Downloading video {idx+1}/{len(self.videos_to_download)}: "
+            f"{self._listbox_titles[idx]}"
+        )
 
     # --- UI Update Methods (executed on main thread via self.after) ---
 
@@ -199,9 +285,15 @@ class App(ctk.CTk):
         )
         self.videos_to_download = details["videos"]
         self.video_streams = details["first_video_streams"]
+        self.quality_options = details.get("qualities")
 
-        for idx, video in enumerate(self.videos_to_download, 1):
-            self.add_to_listbox(f"{idx:02d}. {video.title} - Pending")
+        # Use the titles from the details dict; on a cache hit the YouTube
+        # objects are lazy and touching video.title would hit the network
+        titles: List[str] = details.get("video_titles") or [
+            video.title for video in self.videos_to_download
+        ]
+        for idx, video_title in enumerate(titles, 1):
+            self.add_to_listbox(f"{idx:02d}. {video_title}")
 
         self.update_quality_options()
         self.load_thumbnail(details["thumbnail_url"])
@@ -216,15 +308,21 @@ class App(ctk.CTk):
         Args:
             _ (Optional[str]): Unused parameter for event binding compatibility
         """
-        if self.video_streams:
-            qualities: List[str] = self.handler.get_quality_options(
+        if self.quality_options:
+            qualities: List[str] = self.quality_options.get(self.mode_var.get()) or [
+                "Not Available"
+            ]
+        elif self.video_streams:
+            qualities = self.handler.get_quality_options(
                 self.video_streams, self.mode_var.get()
             )
-            self.quality_menu.configure(values=qualities, state="normal")
-            self.quality_var.set(qualities[0])
         else:
             self.quality_menu.configure(values=["Fetch URL first"], state="disabled")
             self.quality_var.set("Fetch URL first")
+            return
+
+        self.quality_menu.configure(values=qualities, state="normal")
+        self.quality_var.set(qualities[0])
 
     def load_thumbnail(self, url: str) -> None:
         """
@@ -234,9 +332,13 @@ class App(ctk.CTk):
             url (str): URL of the thumbnail image
         """
         try:
-            response: requests.Response = requests.get(url, timeout=5)
-            response.raise_for_status()
-            img_data: Image.Image = Image.open(BytesIO(response.content))
+            with SESSION.get(url, stream=True, timeout=5) as response:
+                response.raise_for_status()
+                # Let PIL read straight from the socket so JPEG decode
+                # overlaps the network receive instead of buffering it all
+                response.raw.decode_content = True
+                img_data: Image.Image = Image.open(response.raw)
+                img_data.load()
             thumbnail_img: ctk.CTkImage = ctk.CTkImage(img_data, size=(120, 90))
             self.thumbnail_label.configure(image=thumbnail_img)
         except requests.RequestException as e:
@@ -245,12 +347,28 @@ class App(ctk.CTk):
             logger.warning(f"Error processing thumbnail: {e}")
 
     def choose_dir(self) -> None:
-        """Open file dialog to choose download directory."""
+        """
+        Open the download directory chooser.
+
+        Tk only supports GUI calls from the thread running the
+        interpreter — dispatching the native dialog from a worker aborts
+        on macOS and gets marshalled back through the mainloop elsewhere —
+        so the dialog stays on the main thread.
+        """
         path: Optional[str] = filedialog.askdirectory(initialdir=self.download_dir)
         if path:
-            self.download_dir = path
-            logger.info(f"Download directory changed to: {self.download_dir}")
-            self.update_dir_label()
+            self._apply_dir(path)
+
+    def _apply_dir(self, path: str) -> None:
+        """
+        Apply a newly chosen download directory.
+
+        Args:
+            path (str): Directory selected in the chooser
+        """
+        self.download_dir = path
+        logger.info(f"Download directory changed to: {self.download_dir}")
+        self.update_dir_label()
 
     def update_dir_label(self) -> None:
         """Update the display label with current download directory."""
@@ -260,16 +378,32 @@ class App(ctk.CTk):
         """
         Callback for download progress updates.
 
+        Invoked once per downloaded chunk, so updates are coalesced to at
+        most ~30 Hz; widget work stays O(seconds) instead of O(chunks). The
+        final update (bytes_remaining == 0) always goes through.
+
         Args:
             stream: Stream object from pytubefix
             chunk (bytes): Downloaded chunk
             bytes_remaining (int): Bytes remaining to download
         """
+        now: float = time.monotonic()
+        if now - self._last_ui < 0.033 and bytes_remaining > 0:
+            return
+        self._last_ui = now
+
         total: int = stream.filesize
         downloaded: int = total - bytes_remaining
         percent: float = downloaded / total if total > 0 else 0
-        self.progressbar.set(percent)
-        self.stats_label.configure(text=f"{downloaded/1e6:.2f}MB / {total/1e6:.2f}MB")
+        self.after(0, self.progressbar.set, percent)
+        # CTk widgets take no positional option dict; bind the text into a
+        # lambda so configure receives it as a keyword
+        self.after(
+            0,
+            lambda t=f"{downloaded/1e6:.2f}MB / {total/1e6:.2f}MB": self.stats_label.configure(
+                text=t
+            ),
+        )
 
     def reset_progress(self) -> None:
         """Reset progress bar and stats to initial state."""
@@ -288,21 +422,20 @@ class App(ctk.CTk):
         self.reset_ui_state()
 
     def clear_listbox(self) -> None:
-        """Clear all content from the video list textbox."""
-        self.listbox.configure(state="normal")
-        self.listbox.delete("1.0", tkinter.END)
-        self.listbox.configure(state="disabled")
+        """Clear all entries from the video listbox."""
+        self.listbox.delete(0, tkinter.END)
+        self._listbox_titles.clear()
 
-    def add_to_listbox(self, text: str) -> None:
+    def add_to_listbox(self, title: str, status: str = "Pending") -> None:
         """
-        Add a line of text to the video list textbox.
+        Add a video entry to the listbox.
 
         Args:
-            text (str): Text to add to the listbox
+            title (str): Display title of the video
+            status (str): Initial status text
         """
-        self.listbox.configure(state="normal")
-        self.listbox.insert(tkinter.END, text + "\n")
-        self.listbox.configure(state="disabled")
+        self._listbox_titles.append(title)
+        self.listbox.insert(tkinter.END, f"{title} - {status}")
 
     def update_listbox_status(self, index: int, status: str) -> None:
         """
@@ -318,17 +451,12 @@ class App(ctk.CTk):
         """
         Update listbox status on the main thread (thread-safe).
 
+        Replaces the single affected entry; the original titles are kept in
+        self._listbox_titles so no widget content needs to be parsed.
+
         Args:
             index (int): Index of the video
             status (str): New status text
         """
-        self.listbox.configure(state="normal")
-        full_text: List[str] = self.listbox.get("1.0", tkinter.END).strip().split("\n")
-        line_parts: List[str] = full_text[index].split(" - ")
-        # Re-join in case title had hyphens
-        original_title: str = " - ".join(line_parts[:-1])
-        full_text[index] = f"{original_title} - {status}"
-
-        self.listbox.delete("1.0", tkinter.END)
-        self.listbox.insert("1.0", "\n".join(full_text))
-        self.listbox.configure(state="disabled")
\ No newline at end of file
+        self.listbox.delete(index)
+        self.listbox.insert(index, f"{self._listbox_titles[index]} - {status}")
\ No newline at end of file
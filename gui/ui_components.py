@@ -5,10 +5,40 @@ Contains factory functions for creating reusable UI components and frames
 for the Pro YouTube Downloader application.
 """
 
+import tkinter
 from typing import Any, Callable, Optional, Tuple
 
 import customtkinter as ctk
-from PIL import Image
+
+# The small font allocates a Tk resource; created lazily and reused.
+_small_font: Optional[ctk.CTkFont] = None
+
+
+def _get_small_font() -> ctk.CTkFont:
+    """Lazily create and memoize the small label font."""
+    global _small_font
+    if _small_font is None:
+        _small_font = ctk.CTkFont(size=10)
+    return _small_font
+
+
+# Placeholder thumbnail; building it costs a PIL image plus a Tk PhotoImage,
+# so it is created once and reused across window (re)builds.
+_placeholder_img: Optional[ctk.CTkImage] = None
+
+
+def _get_placeholder() -> ctk.CTkImage:
+    """Lazily create and memoize the placeholder thumbnail image."""
+    global _placeholder_img
+    if _placeholder_img is None:
+        # Imported here rather than at module top so `python main.py`
+        # reaches its first window draw without paying for PIL at startup
+        from PIL import Image
+
+        _placeholder_img = ctk.CTkImage(
+            Image.new("RGB", (120, 90), (50, 50, 50)), size=(120, 90)
+        )
+    return _placeholder_img
 
 
 def create_top_frame(
@@ -43,8 +73,7 @@ def create_top_frame(
     fetch_button = ctk.CTkButton(frame, text="Fetch Details", command=fetch_callback)
     fetch_button.grid(row=0, column=2, padx=(5, 10), pady=10)
 
-    placeholder_img = ctk.CTkImage(Image.new("RGB", (120, 90), (50, 50, 50)), size=(120, 90))
-    thumbnail_label = ctk.CTkLabel(frame, text="", image=placeholder_img)
+    thumbnail_label = ctk.CTkLabel(frame, text="", image=_get_placeholder())
     thumbnail_label.grid(row=1, column=0, padx=10, pady=10)
 
     title_label = ctk.CTkLabel(
@@ -96,35 +125,44 @@ def create_middle_frame(
     dir_button.grid(row=0, column=2, padx=10, pady=10)
 
     dir_label = ctk.CTkLabel(
-        frame, text="Folder: ", wraplength=700, font=ctk.CTkFont(size=10)
+        frame, text="Folder: ", wraplength=700, font=_get_small_font()
     )
     dir_label.grid(row=1, column=0, columnspan=3, padx=10, pady=(0, 10), sticky="ew")
 
     return frame, quality_menu, dir_label
 
 
-def create_list_frame(master: Any) -> Tuple[ctk.CTkFrame, ctk.CTkTextbox]:
+def create_list_frame(master: Any) -> Tuple[ctk.CTkFrame, tkinter.Listbox]:
     """
     Create the frame containing the video list display.
 
+    Uses a plain tkinter Listbox so a single entry can be replaced in O(1)
+    instead of rewriting the whole widget on every status change.
+
     Args:
         master: Parent widget
 
     Returns:
         Tuple containing:
         - frame: The container frame
-        - listbox: Textbox widget for displaying video list
+        - listbox: Listbox widget for displaying video list
     """
     frame = ctk.CTkFrame(master)
     frame.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="nsew")
     frame.grid_rowconfigure(0, weight=1)
     frame.grid_columnconfigure(0, weight=1)
 
-    listbox = ctk.CTkTextbox(
-        frame, fg_color="#2B2B2B", text_color="white", font=("Consolas", 12), border_width=0
+    listbox = tkinter.Listbox(
+        frame,
+        bg="#2B2B2B",
+        fg="white",
+        selectbackground="#1F6AA5",
+        font=("Consolas", 12),
+        relief="flat",
+        borderwidth=0,
+        highlightthickness=0,
     )
     listbox.grid(row=0, column=0, sticky="nsew")
-    listbox.configure(state="disabled")  # Make it read-only
 
     return frame, listbox
 
@@ -29,13 +29,13 @@ def check_environment() -> bool:
         bool: True if all checks pass, False otherwise.
     """
     logger.info("Checking Python environment...")
-    logger.info(f"Python Executable: {sys.executable}")
-    logger.info(f"Current Working Directory: {os.getcwd()}")
+    logger.info("Python Executable: %s", sys.executable)
+    logger.info("Current Working Directory: %s", os.getcwd())
 
     logger.info("Looking for 'ffmpeg'...")
     ffmpeg_location = shutil.which("ffmpeg")
     if ffmpeg_location:
-        logger.info(f"✅ Found ffmpeg at: {ffmpeg_location}")
+        logger.info("✅ Found ffmpeg at: %s", ffmpeg_location)
         return True
     else:
         logger.warning(
@@ -54,7 +54,7 @@ def main() -> None:
         app = App()
         app.mainloop()
     except Exception as e:
-        logger.error(f"Failed to start application: {e}", exc_info=True)
+        logger.error("Failed to start application: %s", e, exc_info=True)
         sys.exit(1)
 
 
@@ -1,6 +1,7 @@
 """Utility modules for Pro YouTube Downloader."""
 
+from .async_downloader import download_one
 from .helpers import sanitize_filename
 from .youtube_handler import YouTubeHandler
 
-__all__ = ["sanitize_filename", "YouTubeHandler"]
+__all__ = ["download_one", "sanitize_filename", "YouTubeHandler"]
@@ -0,0 +1,53 @@
+"""
+Async Downloader Module
+
+Runs multiple video downloads concurrently on an asyncio event loop so
+playlist items overlap their network I/O instead of running one-by-one.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of videos downloaded in parallel.
+MAX_CONCURRENT_DOWNLOADS = 4
+
+
+async def download_one(
+    handler: Any,
+    video: Any,
+    quality: str,
+    mode: str,
+    save_path: str,
+    prefix: str,
+    sem: asyncio.Semaphore,
+    on_start: Optional[Callable[[], None]] = None,
+) -> None:
+    """
+    Download a single video once a semaphore slot is available.
+
+    The blocking pytubefix download runs in the default executor so the
+    event loop stays free to drive the other in-flight downloads.
+
+    Args:
+        handler: YouTubeHandler instance that performs the actual download
+        video: YouTube object from pytubefix
+        quality (str): Selected quality (resolution or bitrate)
+        mode (str): "Audio" or "Video"
+        save_path (str): Directory to save the file
+        prefix (str): Filename prefix (e.g., "01." for playlists)
+        sem (asyncio.Semaphore): Bounds the number of parallel downloads
+        on_start (Optional[Callable]): Called when the download actually starts
+
+    Raises:
+        Exception: Propagated from YouTubeHandler.download on failure
+    """
+    async with sem:
+        if on_start is not None:
+            on_start()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, handler.download, video, quality, mode, save_path, prefix
+        )
@@ -0,0 +1,80 @@
+"""
+HTTP Utilities Module
+
+Provides a shared requests.Session so the application's direct HTTP calls
+(thumbnails and other metadata) reuse pooled keep-alive connections
+instead of paying a fresh TCP/TLS handshake per request.
+"""
+
+import logging
+import urllib.request
+import urllib.response
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# One adapter covers the handful of hosts the app talks to directly
+# (i.ytimg.com, www.youtube.com) with enough keep-alive slots for the
+# concurrent download workers.
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+
+SESSION = requests.Session()
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+_opener_installed = False
+
+
+def install_pooled_opener() -> None:
+    """
+    Route urllib.request through a keep-alive connection pool.
+
+    pytubefix sends its watch-page, manifest and chunk requests through
+    urllib.request, which opens a fresh TCP/TLS connection each time.
+    Installing an opener backed by a urllib3 PoolManager (urllib3 ships
+    with requests) lets those calls reuse connections, skipping a
+    handshake round-trip per request after the first.
+
+    Side-effect: this replaces the process-wide default urllib opener,
+    so every urllib.request.urlopen call in the process goes through the
+    pool. Idempotent; only the first call installs anything, and any
+    failure falls back silently to the stock opener.
+    """
+    global _opener_installed
+    if _opener_installed:
+        return
+    try:
+        import urllib3
+
+        # Enough keep-alive slots for the concurrent download workers
+        pool = urllib3.PoolManager(maxsize=16)
+
+        class _PooledHTTPSHandler(urllib.request.HTTPSHandler):
+            """HTTPS handler serving requests from the shared pool."""
+
+            def https_open(self, req):
+                timeout = req.timeout if isinstance(req.timeout, (int, float)) else None
+                response = pool.urlopen(
+                    req.get_method(),
+                    req.full_url,
+                    body=req.data,
+                    headers=dict(req.header_items()),
+                    # Leave redirects and error handling to the urllib
+                    # opener chain, which pytubefix relies on
+                    redirect=False,
+                    retries=False,
+                    preload_content=False,
+                    timeout=timeout,
+                )
+                return urllib.response.addinfourl(
+                    response, response.headers, req.full_url, response.status
+                )
+
+        urllib.request.install_opener(urllib.request.build_opener(_PooledHTTPSHandler()))
+        _opener_installed = True
+    except Exception as e:
+        # Pooling is an optimization; keep downloads working on the
+        # stock opener if the urllib3 bridge cannot be set up
+        logger.warning("Could not install pooled urllib opener: %s", e)
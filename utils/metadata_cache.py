@@ -0,0 +1,78 @@
+"""
+Metadata Cache Module
+
+Persists minimal video/playlist metadata (titles, thumbnail URLs and
+quality lists) so re-fetching a previously seen URL skips the watch-page
+and manifest round-trips entirely.
+"""
+
+import logging
+import os
+import shelve
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "proytdl")
+_CACHE_FILE = os.path.join(_CACHE_DIR, "metadata")
+
+# Playlists mutate, so cached listings go stale; entries older than this
+# are treated as misses and refetched
+_TTL_SECONDS = 24 * 60 * 60
+
+
+class MetadataCache:
+    """Two-level cache: an in-memory dict backed by a shelve file on disk."""
+
+    def __init__(self) -> None:
+        """Initialize the in-memory layer; the disk layer is opened lazily."""
+        self._memory: Dict[str, Dict[str, Any]] = {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached entry.
+
+        Expired entries (older than the module TTL) are treated as misses
+        so mutated playlists are eventually refetched.
+
+        Args:
+            key (str): Cache key (e.g., "video:<id>" or "playlist:<id>")
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached entry, or None on a miss.
+        """
+        record = self._memory.get(key)
+        if record is None:
+            try:
+                with shelve.open(_CACHE_FILE) as db:
+                    record = db.get(key)
+            except OSError as e:
+                logger.warning("Metadata cache unavailable: %s", e)
+                return None
+        if record is None:
+            return None
+        # Records from before the TTL was introduced have no timestamp;
+        # treat them as expired rather than frozen forever
+        if time.time() - record.get("saved_at", 0) > _TTL_SECONDS:
+            self._memory.pop(key, None)
+            return None
+        self._memory[key] = record
+        return record["data"]
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store an entry in both cache layers.
+
+        Args:
+            key (str): Cache key
+            entry (Dict[str, Any]): Minimal metadata dict to persist
+        """
+        record = {"saved_at": time.time(), "data": entry}
+        self._memory[key] = record
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            with shelve.open(_CACHE_FILE) as db:
+                db[key] = record
+        except OSError as e:
+            logger.warning("Failed to persist metadata cache entry: %s", e)
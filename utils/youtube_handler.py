@@ -5,28 +5,84 @@ Handles all YouTube fetching, quality extraction, and downloading operations.
 Supports both single videos and playlists with audio and video formats.
 """
 
+import errno
+import heapq
 import logging
 import os
 import re
+import shutil
 import subprocess
-from typing import Any, Dict, List
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 
 from pytubefix import YouTube, Playlist
 
+try:
+    # Optional: remux in-process instead of spawning an ffmpeg subprocess
+    import av
+except ImportError:
+    av = None
+
 from .helpers import sanitize_filename
+from .http import install_pooled_opener
+from .metadata_cache import MetadataCache
 
 logger = logging.getLogger(__name__)
 
+# Standard 11-character video ID in path-style URLs (youtu.be, shorts, embed)
+_VIDEO_ID_RE = re.compile(r"(?:youtu\.be/|shorts/|embed/)([0-9A-Za-z_-]{11})")
+
+
+def _abr_to_int(abr: Optional[str]) -> int:
+    """
+    Numeric value of an audio bitrate label such as "128kbps".
+
+    Args:
+        abr (Optional[str]): Bitrate label, possibly None
+
+    Returns:
+        int: The numeric bitrate, or 0 if the label is missing.
+    """
+    return int("".join(ch for ch in abr if ch.isdigit())) if abr else 0
+
+# Write-side buffer for downloads. pytubefix delivers ~9 KB chunks; batching
+# them into 8 MB writes keeps the disk side kernel-bound instead of
+# chunk-bound.
+_WRITE_BUFFER_SIZE = 8 * 1024 * 1024
+
 
 class YouTubeHandler:
     """Handles all YouTube fetching and downloading operations."""
 
-    def fetch_details(self, url: str) -> Dict[str, Any]:
+    def __init__(self) -> None:
+        """Initialize the handler and its metadata cache."""
+        self._cache: MetadataCache = MetadataCache()
+        # Serializes temp-file merges so several downloads finishing at once
+        # don't kick off competing remuxes
+        self._merge_lock: threading.Lock = threading.Lock()
+        # Resolve ffmpeg once rather than paying a PATH search per merge;
+        # the bare name is kept as a fallback so the per-merge error
+        # message still fires if ffmpeg is missing
+        self._ffmpeg: str = shutil.which("ffmpeg") or "ffmpeg"
+        # pytubefix talks HTTP via urllib.request; give it pooled
+        # keep-alive connections (process-wide side-effect, see http.py)
+        install_pooled_opener()
+
+    def fetch_details(self, url: str, refresh: bool = False) -> Dict[str, Any]:
         """
         Fetch details for a given YouTube URL (video or playlist).
 
+        Previously seen URLs are served from a persistent metadata cache;
+        the YouTube objects are then rebuilt lazily, so no network traffic
+        happens until an actual download starts.
+
         Args:
             url (str): YouTube URL (video or playlist)
+            refresh (bool): Bypass the metadata cache and refetch
 
         Returns:
             Dict[str, Any]: Dictionary containing:
@@ -34,41 +90,169 @@ class YouTubeHandler:
                 - is_playlist (bool): Whether it's a playlist
                 - title (str): Title of the video/playlist
                 - videos (list): List of YouTube objects
+                - video_titles (list): Display titles, one per video
                 - first_video_streams: Stream objects for quality selection
+                  (None when served from cache)
                 - thumbnail_url (str): URL to the thumbnail
+                - qualities (dict): Quality options keyed by mode
                 - error (str): Error message if success is False
         """
+        kind, media_id = self._classify(url)
+        cache_key = f"{kind}:{media_id}" if media_id else None
+        if not refresh and cache_key:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.info("Metadata cache hit for %s", cache_key)
+                return self._details_from_cache(url, cached)
+
         try:
-            if "playlist" in url:
+            if kind == "playlist":
                 playlist = Playlist(url)
-                if not playlist.videos:
+                # Playlist.videos is an uncached property that yields fresh
+                # YouTube objects on every access; materialize it once so the
+                # prefetched objects are the same ones handed to the UI
+                videos = list(playlist.videos)
+                if not videos:
                     raise ValueError("Playlist is empty or invalid.")
 
-                first_video = playlist.videos[0]
-                logger.info(f"Fetched playlist: {playlist.title} with {len(playlist.videos)} videos")
-                return {
+                self._prefetch(videos)
+                first_video = videos[0]
+                logger.info("Fetched playlist: %s with %d videos", playlist.title, len(videos))
+                details = {
                     "success": True,
                     "is_playlist": True,
                     "title": playlist.title,
-                    "videos": playlist.videos,
+                    "videos": videos,
+                    "video_titles": [v.title for v in videos],
                     "first_video_streams": first_video.streams,
                     "thumbnail_url": first_video.thumbnail_url,
                 }
             else:
                 video = YouTube(url)
-                logger.info(f"Fetched video: {video.title}")
-                return {
+                logger.info("Fetched video: %s", video.title)
+                details = {
                     "success": True,
                     "is_playlist": False,
                     "title": video.title,
                     "videos": [video],
+                    "video_titles": [video.title],
                     "first_video_streams": video.streams,
                     "thumbnail_url": video.thumbnail_url,
                 }
+
+            details["qualities"] = {
+                mode: self.get_quality_options(details["first_video_streams"], mode)
+                for mode in ("Video", "Audio")
+            }
+            if cache_key:
+                self._cache.put(cache_key, self._cache_entry(details))
+            return details
         except Exception as e:
-            logger.error(f"Failed to fetch details from URL: {e}")
+            logger.error("Failed to fetch details from URL: %s", e)
             return {"success": False, "error": str(e)}
 
+    @staticmethod
+    def _classify(url: str) -> Tuple[str, Optional[str]]:
+        """
+        Classify a YouTube URL as a playlist or a single video.
+
+        Parses the URL once instead of substring-matching "playlist", which
+        misses list= watch URLs and would send shortened or embed links
+        down the wrong path, costing a doomed network round-trip.
+
+        Args:
+            url (str): YouTube URL
+
+        Returns:
+            Tuple[str, Optional[str]]: ("playlist" or "video", extracted
+                playlist/video ID or None)
+        """
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query)
+
+        playlist_id = query.get("list", [None])[0]
+        if playlist_id:
+            return "playlist", playlist_id
+
+        video_id = query.get("v", [None])[0]
+        if not video_id:
+            match = _VIDEO_ID_RE.search(url)
+            video_id = match.group(1) if match else None
+        return "video", video_id
+
+    @staticmethod
+    def _cache_entry(details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reduce a details dict to the minimal picklable metadata.
+
+        Args:
+            details (Dict[str, Any]): Full result of a network fetch
+
+        Returns:
+            Dict[str, Any]: Entry suitable for MetadataCache.put
+        """
+        return {
+            "is_playlist": details["is_playlist"],
+            "title": details["title"],
+            "video_urls": [v.watch_url for v in details["videos"]],
+            "video_titles": details["video_titles"],
+            "thumbnail_url": details["thumbnail_url"],
+            "qualities": details["qualities"],
+        }
+
+    @staticmethod
+    def _details_from_cache(url: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Rebuild a details dict from a cached entry.
+
+        YouTube objects are constructed lazily from the stored watch URLs,
+        so this performs no network I/O.
+
+        Args:
+            url (str): Originally requested URL
+            entry (Dict[str, Any]): Cached metadata entry
+
+        Returns:
+            Dict[str, Any]: Details dict matching fetch_details' contract
+        """
+        if entry["is_playlist"]:
+            videos = [YouTube(watch_url) for watch_url in entry["video_urls"]]
+        else:
+            videos = [YouTube(url)]
+        return {
+            "success": True,
+            "is_playlist": entry["is_playlist"],
+            "title": entry["title"],
+            "videos": videos,
+            "video_titles": entry["video_titles"],
+            "first_video_streams": None,
+            "thumbnail_url": entry["thumbnail_url"],
+            "qualities": entry["qualities"],
+        }
+
+    def _prefetch(self, videos: List[Any]) -> None:
+        """
+        Warm per-video metadata in parallel.
+
+        pytubefix resolves title and thumbnail lazily - one HTTP round-trip
+        per video on first access - so a large playlist would otherwise walk
+        them one by one when the GUI builds its list. Touching them through
+        a thread pool caches everything on the objects in O(RTT) wall time.
+
+        Args:
+            videos (List[Any]): YouTube objects to warm
+        """
+        def warm(video: Any) -> None:
+            try:
+                video.title
+                video.thumbnail_url
+            except Exception as e:
+                # One broken video must not abort the whole prefetch
+                logger.warning("Metadata prefetch failed: %s", e)
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(warm, videos))
+
     def get_quality_options(self, streams: Any, mode: str) -> List[str]:
         """
         Get available quality options based on the mode.
@@ -82,26 +266,26 @@ class YouTubeHandler:
         """
         qualities: List[str] = []
         try:
+            # Classify every stream in a single pass; each filter() call
+            # would walk the full list again and re-read stream attributes.
+            # The numeric value of each label is parsed once here, so the
+            # sorts below do plain dict lookups per comparison.
+            resolution_int: Dict[str, int] = {}
+            abr_int: Dict[str, int] = {}
+            for stream in streams:
+                if stream.resolution:
+                    if stream.resolution not in resolution_int:
+                        resolution_int[stream.resolution] = int(stream.resolution[:-1])
+                elif stream.abr:
+                    if stream.abr not in abr_int:
+                        abr_int[stream.abr] = _abr_to_int(stream.abr)
+
             if mode == "Audio":
-                audio_streams = streams.filter(only_audio=True).order_by("abr").desc()
-                qualities = sorted(
-                    list(set(s.abr for s in audio_streams if s.abr)),
-                    key=lambda x: int(re.sub(r"\D", "", x)),
-                    reverse=True,
-                )
+                qualities = sorted(abr_int, key=abr_int.get, reverse=True)
             else:  # Video
-                progressive_streams = list(streams.filter(progressive=True))
-                adaptive_streams = list(streams.filter(only_video=True))
-                all_streams = progressive_streams + adaptive_streams
-
-                resolutions = set(s.resolution for s in all_streams if s.resolution)
-                qualities = sorted(
-                    list(resolutions),
-                    key=lambda x: int(x[:-1]),
-                    reverse=True,
-                )
+                qualities = sorted(resolution_int, key=resolution_int.get, reverse=True)
         except Exception as e:
-            logger.error(f"Error getting quality options: {e}")
+            logger.error("Error getting quality options: %s", e)
 
         return qualities if qualities else ["Not Available"]
 
@@ -128,9 +312,9 @@ class YouTubeHandler:
                 self._download_audio(video, quality, save_path, sanitized_title)
             else:  # Video
                 self._download_video(video, quality, save_path, sanitized_title)
-            logger.info(f"Successfully downloaded: {sanitized_title}")
+            logger.info("Successfully downloaded: %s", sanitized_title)
         except Exception as e:
-            logger.error(f"Download failed for {sanitized_title}: {e}")
+            logger.error("Download failed for %s: %s", sanitized_title, e)
             raise
 
     def _download_audio(self, yt: YouTube, quality: str, save_path: str, file_title: str) -> None:
@@ -146,15 +330,179 @@ class YouTubeHandler:
         Raises:
             Exception: If no audio stream is available
         """
-        stream = yt.streams.filter(only_audio=True, abr=quality).first()
-        if not stream:
-            stream = yt.streams.filter(only_audio=True).order_by("abr").desc().first()
+        # Collect the audio-only candidates in one pass, then take the exact
+        # bitrate match or fall back to the highest; the old double
+        # filter/order_by walked the stream list twice
+        audio_streams = [
+            s for s in yt.streams
+            if s.includes_audio_track and not s.includes_video_track
+        ]
+        stream = next((s for s in audio_streams if s.abr == quality), None)
+        if not stream and audio_streams:
+            stream = max(audio_streams, key=lambda s: _abr_to_int(s.abr))
 
         if not stream:
             raise Exception("No audio stream found.")
 
-        logger.info(f"Downloading audio: {file_title}")
-        stream.download(output_path=save_path, filename=f"{file_title}.mp3")
+        logger.info("Downloading audio: %s", file_title)
+        self._stream_to_file(stream, os.path.join(save_path, f"{file_title}.mp3"))
+
+    def _stream_to_file(self, stream: Any, file_path: str) -> None:
+        """
+        Download a stream to disk through a large write buffer.
+
+        Progress callbacks registered on the parent YouTube object still
+        fire per chunk; only the write side is batched.
+
+        Args:
+            stream: Stream object from pytubefix
+            file_path (str): Destination path for the download
+        """
+        with open(file_path, "wb", buffering=_WRITE_BUFFER_SIZE) as file_handle:
+            stream.stream_to_buffer(file_handle)
+
+        # The app never re-reads what it just downloaded; drop the pages so
+        # a long playlist run doesn't pin gigabytes of page cache
+        if hasattr(os, "posix_fadvise"):
+            try:
+                fd = os.open(file_path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                logger.debug("posix_fadvise failed for %s: %s", file_path, e)
+
+    @staticmethod
+    def _remux_with_av(video_file: str, audio_file: str, output_file: str) -> None:
+        """
+        Remux separate video and audio files into one container in-process.
+
+        PyAV performs the same stream copy as the ffmpeg subprocess but
+        without the process spawn or PATH dependency; packets are copied
+        unmodified with their timestamps intact, interleaved by timestamp
+        so the output is a properly interleaved mp4 rather than all video
+        followed by all audio.
+
+        Args:
+            video_file (str): Path to the video-only input
+            audio_file (str): Path to the audio-only input
+            output_file (str): Path of the merged output
+
+        Raises:
+            Exception: On any PyAV failure; the caller falls back to the
+                ffmpeg subprocess.
+        """
+        with av.open(video_file) as video_in, av.open(audio_file) as audio_in, av.open(
+            output_file, "w"
+        ) as output:
+
+            def out_stream(template: Any) -> Any:
+                # add_stream(template=...) was removed in PyAV 13 in favour
+                # of add_stream_from_template; av is an unpinned optional
+                # dependency, so support both
+                if hasattr(output, "add_stream_from_template"):
+                    return output.add_stream_from_template(template)
+                return output.add_stream(template=template)
+
+            def packets(container: Any, stream: Any, target: Any) -> Any:
+                for packet in container.demux(stream):
+                    if packet.dts is None:
+                        continue
+                    packet.stream = target
+                    yield packet
+
+            video_out = out_stream(video_in.streams.video[0])
+            audio_out = out_stream(audio_in.streams.audio[0])
+
+            # Merge the two packet iterators by timestamp (in seconds, so
+            # the differing time bases compare correctly)
+            merged = heapq.merge(
+                packets(video_in, video_in.streams.video[0], video_out),
+                packets(audio_in, audio_in.streams.audio[0], audio_out),
+                key=lambda p: float(p.dts * p.time_base),
+            )
+            for packet in merged:
+                output.mux(packet)
+
+    def _merge_via_pipes(self, video_stream: Any, audio_stream: Any, output_file: str) -> None:
+        """
+        Mux two streams into the output file while they are still downloading.
+
+        POSIX-only: each stream is fed through a named pipe into ffmpeg, so
+        no intermediate files hit the disk and the stream-copy mux overlaps
+        the network transfer.
+
+        Args:
+            video_stream: Video-only stream from pytubefix
+            audio_stream: Audio-only stream from pytubefix
+            output_file (str): Path of the merged output
+
+        Raises:
+            Exception: If FFmpeg is missing or the merge fails
+        """
+        pipe_dir = tempfile.mkdtemp()
+        video_pipe = os.path.join(pipe_dir, "video.pipe")
+        audio_pipe = os.path.join(pipe_dir, "audio.pipe")
+        try:
+            os.mkfifo(video_pipe)
+            os.mkfifo(audio_pipe)
+
+            try:
+                process = subprocess.Popen(
+                    [self._ffmpeg, "-y", "-i", video_pipe, "-i", audio_pipe, "-c", "copy", output_file],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            except FileNotFoundError:
+                raise Exception(
+                    "FFmpeg not found. Please ensure FFmpeg is installed and added to your system PATH. "
+                    "Download from: https://ffmpeg.org/download.html"
+                )
+
+            def feed(stream: Any, pipe_path: str) -> None:
+                # A blocking open() sleeps until ffmpeg opens the read end;
+                # if ffmpeg exits first (bad probe, unwritable output) that
+                # never happens. Open non-blocking and retry while ffmpeg is
+                # alive so a failed start raises instead of hanging forever.
+                fd: Optional[int] = None
+                while fd is None:
+                    try:
+                        fd = os.open(pipe_path, os.O_WRONLY | os.O_NONBLOCK)
+                    except OSError as e:
+                        if e.errno != errno.ENXIO:
+                            raise
+                        if process.poll() is not None:
+                            raise Exception("FFmpeg exited before reading its input pipes.")
+                        time.sleep(0.05)
+                os.set_blocking(fd, True)
+                with os.fdopen(fd, "wb") as pipe:
+                    stream.stream_to_buffer(pipe)
+
+            # No `with` around the executor: its __exit__ would wait on a
+            # feeder that can only unblock after ffmpeg is killed below
+            executor = ThreadPoolExecutor(max_workers=2)
+            futures = [
+                executor.submit(feed, video_stream, video_pipe),
+                executor.submit(feed, audio_stream, audio_pipe),
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except Exception:
+                # Reap ffmpeg so the other feeder gets EPIPE/ENXIO and the
+                # failure propagates instead of leaving a zombie behind
+                process.kill()
+                process.wait()
+                raise
+            finally:
+                executor.shutdown(wait=True)
+
+            if process.wait() != 0:
+                raise Exception("FFmpeg merge failed.")
+        finally:
+            # The pipes vanish with their temporary directory
+            shutil.rmtree(pipe_dir, ignore_errors=True)
 
     def _download_video(self, yt: YouTube, quality: str, save_path: str, file_title: str) -> None:
         """
@@ -171,81 +519,101 @@ class YouTubeHandler:
         Raises:
             Exception: If video/audio streams not found or FFmpeg fails
         """
-        # Try progressive stream first (video+audio combined)
-        progressive_stream = yt.streams.filter(progressive=True, res=quality).first()
+        # Pick all three candidates in one pass over the stream list; the
+        # old chain of filter/order_by calls rescanned it three times
+        progressive_stream = None
+        video_stream = None
+        audio_stream = None
+        best_abr = -1
+        for s in yt.streams:
+            if s.resolution == quality and s.is_progressive:
+                if progressive_stream is None:
+                    progressive_stream = s
+            elif s.resolution == quality and not s.includes_audio_track:
+                if video_stream is None:
+                    video_stream = s
+            elif s.includes_audio_track and not s.includes_video_track:
+                abr = _abr_to_int(s.abr)
+                if abr > best_abr:
+                    best_abr = abr
+                    audio_stream = s
+
+        # Prefer the progressive stream (video+audio combined)
         if progressive_stream:
-            logger.info(f"Downloading progressive stream: {file_title}")
-            progressive_stream.download(output_path=save_path, filename=f"{file_title}.mp4")
+            logger.info("Downloading progressive stream: %s", file_title)
+            self._stream_to_file(progressive_stream, os.path.join(save_path, f"{file_title}.mp4"))
             return
 
         # If no progressive stream, download separately and merge
-        logger.info(f"No progressive stream found. Downloading video and audio separately: {file_title}")
-        video_stream = (
-            yt.streams.filter(only_video=True, res=quality).order_by("resolution").desc().first()
-        )
-        audio_stream = yt.streams.filter(only_audio=True).order_by("abr").desc().first()
+        logger.info("No progressive stream found. Downloading video and audio separately: %s", file_title)
 
         if not video_stream or not audio_stream:
             raise Exception(f"Could not find separate video/audio streams for {quality}.")
 
-        # Define file paths for temporary files
-        video_file = os.path.join(save_path, f"{file_title}_video.mp4")
-        audio_file = os.path.join(save_path, f"{file_title}_audio.mp4")
         output_file = os.path.join(save_path, f"{file_title}.mp4")
 
-        try:
-            # Download streams
-            video_stream.download(filename=video_file)
-            audio_stream.download(filename=audio_file)
-
-            # Merge with FFmpeg
-            logger.info(f"Merging video and audio: {file_title}")
-            subprocess.run(
-                [
-                    "ffmpeg",
-                    "-y",
-                    "-i",
-                    video_file,
-                    "-i",
-                    audio_file,
-                    "-c",
-                    "copy",
-                    output_file,
-                ],
-                check=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        except FileNotFoundError:
-            raise Exception(
-                "FFmpeg not found. Please ensure FFmpeg is installed and added to your system PATH. "
-                "Download from: https://ffmpeg.org/download.html"
-            )
-        except subprocess.CalledProcessError as e:
-            raise Exception(f"FFmpeg merge failed: {e}")
-        finally:
-            # Clean up temporary files
-            for temp_file in [video_file, audio_file]:
-                if os.path.exists(temp_file):
-                    try:
-                        os.remove(temp_file)
-                        logger.debug(f"Cleaned up temporary file: {temp_file}")
-                    except OSError as e:
-                        logger.warning(f"Failed to remove temporary file {temp_file}: {e}")
-
-        # Download streams
-        video_stream.download(filename=video_file)
-        audio_stream.download(filename=audio_file)
+        if hasattr(os, "mkfifo"):
+            # POSIX: feed both streams through named pipes straight into
+            # ffmpeg, so nothing is written twice and the stream-copy mux
+            # overlaps the network transfer
+            logger.info("Merging video and audio via pipes: %s", file_title)
+            self._merge_via_pipes(video_stream, audio_stream, output_file)
+            return
 
-        # Merge with FFmpeg
-        try:
-            subprocess.run([
-                "ffmpeg", "-y", "-i", video_file, "-i", audio_file,
-                "-c", "copy", output_file
-            ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            raise Exception("FFmpeg failed to merge files. Ensure FFmpeg is installed and in your system's PATH.")
-        finally:
-            # Clean up temporary files
-            if os.path.exists(video_file): os.remove(video_file)
-            if os.path.exists(audio_file): os.remove(audio_file)
\ No newline at end of file
+        # Windows fallback: download to a temporary directory, then merge.
+        # Created inside save_path so the merge never copies across
+        # filesystems; cleanup is handled by the context manager
+        with tempfile.TemporaryDirectory(dir=save_path) as temp_dir:
+            video_file = os.path.join(temp_dir, "video.mp4")
+            audio_file = os.path.join(temp_dir, "audio.mp4")
+
+            try:
+                # Download the two independent streams concurrently; they are
+                # separate HTTP GETs and each can saturate its own TCP flow
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    futures = [
+                        executor.submit(self._stream_to_file, video_stream, video_file),
+                        executor.submit(self._stream_to_file, audio_stream, audio_file),
+                    ]
+                    for future in futures:
+                        future.result()
+
+                # Merge the temporary files; the lock keeps concurrent batch
+                # downloads from remuxing several videos at the same time
+                logger.info("Merging video and audio: %s", file_title)
+                with self._merge_lock:
+                    merged = False
+                    if av is not None:
+                        try:
+                            self._remux_with_av(video_file, audio_file, output_file)
+                            merged = True
+                        except Exception as e:
+                            # In-process remux is best-effort; an API or
+                            # codec incompatibility falls through to ffmpeg
+                            logger.warning(
+                                "PyAV remux failed, falling back to ffmpeg: %s", e
+                            )
+                    if not merged:
+                        subprocess.run(
+                            [
+                                self._ffmpeg,
+                                "-y",
+                                "-i",
+                                video_file,
+                                "-i",
+                                audio_file,
+                                "-c",
+                                "copy",
+                                output_file,
+                            ],
+                            check=True,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL,
+                        )
+            except FileNotFoundError:
+                raise Exception(
+                    "FFmpeg not found. Please ensure FFmpeg is installed and added to your system PATH. "
+                    "Download from: https://ffmpeg.org/download.html"
+                )
+            except subprocess.CalledProcessError as e:
+                raise Exception(f"FFmpeg merge failed: {e}")
\ No newline at end of file